@@ -1,23 +1,121 @@
 #!/usr/bin/env python3
 """Handler for Windows context menu that collects multiple file selections."""
 
+import os
 import sys
 import time
+import ctypes
 import tempfile
+from ctypes import wintypes
 from pathlib import Path
 import subprocess
-import filelock
+
+MUTEX_NAME = 'Local\\pdf_merge_mutex'
+
+WAIT_OBJECT_0 = 0x00000000
+WAIT_ABANDONED = 0x00000080
+WAIT_TIMEOUT = 0x00000102
+
+# A batch is complete once no file has been added for QUIET_PERIOD seconds.
+# Handler start-up (pythonw launch) jitters by a few hundred ms on a busy
+# machine, so the window must tolerate gaps that large between arrivals.
+# A handler that reaches MAX_WAIT while files are still arriving leaves the
+# launch to a later handler, so the window keeps extending during a burst.
+QUIET_PERIOD = 0.4
+MAX_WAIT = 1.5
+POLL_INTERVAL = 0.03
+
+# Partial entries older than this were left behind by a crashed handler
+STALE_PARTIAL_AGE = 60
+
+
+class LockTimeout(Exception):
+    """Raised when the named mutex cannot be acquired in time."""
+
+
+class NamedMutex:
+    """Windows named mutex with the ``with`` interface of ``filelock.FileLock``.
+
+    Waiters are woken by the kernel as soon as the mutex is released instead
+    of polling a lock file.
+    """
+
+    def __init__(self, name, timeout=10):
+        self.name = name
+        self.timeout = timeout
+        self._handle = None
+
+    def __enter__(self):
+        kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        kernel32.CreateMutexW.restype = wintypes.HANDLE
+        kernel32.CreateMutexW.argtypes = [wintypes.LPVOID, wintypes.BOOL, wintypes.LPCWSTR]
+        kernel32.WaitForSingleObject.restype = wintypes.DWORD
+        kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+        kernel32.ReleaseMutex.argtypes = [wintypes.HANDLE]
+        kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        self._kernel32 = kernel32
+
+        handle = kernel32.CreateMutexW(None, False, self.name)
+        if not handle:
+            raise ctypes.WinError(ctypes.get_last_error())
+        
+        result = kernel32.WaitForSingleObject(handle, int(self.timeout * 1000))
+        # An abandoned mutex (previous owner crashed) is still ours now
+        if result not in (WAIT_OBJECT_0, WAIT_ABANDONED):
+            kernel32.CloseHandle(handle)
+            if result == WAIT_TIMEOUT:
+                raise LockTimeout(self.name)
+            raise ctypes.WinError(ctypes.get_last_error())
+        
+        self._handle = handle
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        handle, self._handle = self._handle, None
+        self._kernel32.ReleaseMutex(handle)
+        self._kernel32.CloseHandle(handle)
+        return False
+
 
 def get_session_files():
     """Get paths for session-specific temp files."""
     temp_dir = Path(tempfile.gettempdir())
     return {
-        'collection': temp_dir / 'pdf_merge_collection.txt',
-        'timestamp': temp_dir / 'pdf_merge_timestamp.txt',
-        'lock': temp_dir / 'pdf_merge.lock',
-        'launcher_flag': temp_dir / 'pdf_merge_launcher.flag',
+        'queue': temp_dir / 'pdf_merge_queue',
     }
 
+def list_entries(queue_dir):
+    """Return the entry files currently waiting in the queue directory."""
+    return list(queue_dir.glob('pdf_merge_*.entry'))
+
+def latest_entry_time(entries):
+    """Return when the newest entry appeared, or None if all are gone.
+
+    Handlers stamp the mtime of their entry right after renaming it into
+    place, so this measures when the entry became visible, not when its
+    write started.
+    """
+    latest = None
+    for entry in entries:
+        try:
+            mtime = entry.stat().st_mtime
+        except OSError:
+            # Consumed by a launcher since it was listed
+            continue
+        if latest is None or mtime > latest:
+            latest = mtime
+    return latest
+
+def remove_stale_partials(queue_dir):
+    """Delete partial entries left behind by handlers that crashed."""
+    cutoff = time.time() - STALE_PARTIAL_AGE
+    for partial in queue_dir.glob('pdf_merge_*.tmp'):
+        try:
+            if partial.stat().st_mtime < cutoff:
+                partial.unlink()
+        except OSError:
+            pass
+
 def main():
     if len(sys.argv) < 2:
         return
@@ -27,73 +125,82 @@ def main():
         return
     
     files = get_session_files()
-    lock_file = filelock.FileLock(str(files['lock']), timeout=10)
+    lock_file = NamedMutex(MUTEX_NAME, timeout=10)
     
     try:
-        # Acquire lock and add file
-        with lock_file:
-            # Add this file to collection
-            with open(files['collection'], 'a', encoding='utf-8') as f:
-                f.write(f"{file_path}\n")
-            
-            # Update timestamp
-            with open(files['timestamp'], 'w', encoding='utf-8') as f:
-                f.write(str(time.time()))
-            
-            # Clear launcher flag if it exists
-            files['launcher_flag'].unlink(missing_ok=True)
+        # Add this file as its own entry; names are unique per process so no
+        # lock is needed, and the rename makes the entry appear complete
+        queue_dir = files['queue']
+        queue_dir.mkdir(exist_ok=True)
+        entry_name = f'pdf_merge_{os.getpid()}_{time.time_ns()}'
+        partial = queue_dir / f'{entry_name}.tmp'
+        entry = queue_dir / f'{entry_name}.entry'
+        try:
+            partial.write_text(str(file_path), encoding='utf-8')
+            os.replace(partial, entry)
+        except:
+            partial.unlink(missing_ok=True)
+            raise
+        # The write may have been slow (e.g. antivirus scanning the .tmp);
+        # stamp the entry now so the quiet period counts from its appearance
+        try:
+            os.utime(entry)
+        except FileNotFoundError:
+            # A launcher already consumed (and merged) the entry
+            return
+        
+        # Wait for more files (Windows typically sends them very quickly);
+        # stop as soon as the queue has been quiet for QUIET_PERIOD
+        start = time.time()
+        last_added = start
+        while time.time() - last_added < QUIET_PERIOD and time.time() - start < MAX_WAIT:
+            time.sleep(POLL_INTERVAL)
+            last_added = latest_entry_time(list_entries(queue_dir))
+            if last_added is None:
+                # Queue already consumed by another launcher
+                return
         
-        # Wait for more files (Windows typically sends them very quickly)
-        time.sleep(0.6)
+        # Each handler takes the lock at most once, and only if the batch went
+        # quiet while it waited; the others leave the launch to a newer handler.
+        if time.time() - last_added < QUIET_PERIOD:
+            return
         
         # Try to become the launcher
         with lock_file:
-            # Check if someone already launched
-            if files['launcher_flag'].exists():
-                return
+            remove_stale_partials(queue_dir)
             
-            # Check how long since last file was added
-            try:
-                with open(files['timestamp'], 'r', encoding='utf-8') as f:
-                    last_time = float(f.read().strip())
-            except:
+            # If the queue is empty, someone already launched
+            entries = list_entries(queue_dir)
+            last_time = latest_entry_time(entries)
+            if last_time is None:
                 return
             
             time_diff = time.time() - last_time
             
-            # If less than 0.5 seconds passed, more files might be coming
-            if time_diff < 0.5:
+            # If the batch is not quiet yet, a later handler will launch
+            if time_diff < QUIET_PERIOD:
                 return
             
-            # Mark ourselves as the launcher
-            with open(files['launcher_flag'], 'w') as f:
-                f.write('1')
-            
-            # Collect all files
+            # Collect all files, consuming the entries; this also marks the
+            # batch as launched
             try:
-                with open(files['collection'], 'r', encoding='utf-8') as f:
-                    all_files = [
-                        line.strip() for line in f 
-                        if line.strip() and Path(line.strip()).exists()
-                    ]
-                # Remove duplicates
-                seen = set()
-                unique_files = []
-                for file in all_files:
-                    if file not in seen:
-                        seen.add(file)
-                        unique_files.append(file)
+                paths = []
+                for entry in entries:
+                    paths.append(entry.read_text(encoding='utf-8'))
+                    entry.unlink(missing_ok=True)
+                
+                # Single pass: strip, drop blanks and duplicates (first wins);
+                # missing files are reported by merge_pdfs.py
+                unique_files = list(dict.fromkeys(
+                    path.strip() for path in paths if path.strip()
+                ))
                 
                 # Sort files alphabetically by filename for predictable merge order
                 # This ensures consistent results regardless of selection order
-                unique_files.sort(key=lambda x: Path(x).name.lower())
+                unique_files.sort(key=lambda x: x.rsplit('\\', 1)[-1].lower())
             except:
                 return
             
-            # Clean up temp files
-            for temp_file in [files['collection'], files['timestamp'], files['launcher_flag']]:
-                temp_file.unlink(missing_ok=True)
-            
             # Launch the merge script only if we have 2+ files
             if len(unique_files) >= 2:  # Require at least 2 files
                 script_dir = Path(__file__).parent
@@ -152,7 +259,7 @@ def main():
                         f.write(f"  Script dir: {script_dir}\n")
                         f.write(f"  Files to merge: {len(unique_files)}\n")
     
-    except filelock.Timeout:
+    except LockTimeout:
         # Couldn't acquire lock, exit silently
         pass
     except Exception as e:
@@ -8,12 +8,16 @@ can choose where to write the merged PDF.
 
 from __future__ import annotations
 
-import re
+import collections
+import concurrent.futures
+import contextlib
+import itertools
+import os
 import sys
 import tempfile
 import datetime
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 try:
     from winotify import Notification, audio
@@ -23,7 +27,34 @@ except ImportError:
 
 
 def _load_pdf_backend() -> Tuple[Optional[object], Optional[object], Optional[str]]:
-    """Return PdfReader, PdfWriter and module name if available."""
+    """Return PdfReader, PdfWriter and module name if available.
+
+    pikepdf and PyMuPDF are preferred because they copy page objects in native
+    code. They have no reader/writer classes, so the first slot holds the
+    module itself (passed on to their merge helper) and the second is None.
+    """
+    try:
+        import pikepdf  # type: ignore
+
+        return pikepdf, None, "pikepdf"
+    except ImportError:
+        pass
+
+    try:
+        import pymupdf  # type: ignore
+
+        return pymupdf, None, "pymupdf"
+    except ImportError:
+        pass
+
+    try:
+        # PyMuPDF releases before 1.24.3 only provide the deprecated alias
+        import fitz  # type: ignore
+
+        return fitz, None, "pymupdf"
+    except ImportError:
+        pass
+
     try:
         from pypdf import PdfReader, PdfWriter  # type: ignore
 
@@ -37,10 +68,22 @@ def _load_pdf_backend() -> Tuple[Optional[object], Optional[object], Optional[st
             return None, None, None
 
 
-def _parse_args(argv: Sequence[str]) -> Tuple[List[Path], Optional[Path]]:
-    """Parse command line arguments without relying on argparse."""
+# Select the backend once at import time rather than on every merge.
+_PDF_READER, _PDF_WRITER, _BACKEND = _load_pdf_backend()
+
+# Number of pypdf readers built ahead of the writer on worker threads.
+_PREFETCH_READERS = 4
+
+
+def _parse_args(argv: Sequence[str]) -> Tuple[List[Path], Optional[Path], bool]:
+    """Parse command line arguments without relying on argparse.
+
+    Returns the input PDFs, the explicit output path (if any) and whether
+    content streams may be recompressed (disabled by ``--no-recompress``).
+    """
     pdfs: List[Path] = []
     output: Optional[Path] = None
+    recompress = True
     it = iter(argv)
 
     for token in it:
@@ -50,51 +93,95 @@ def _parse_args(argv: Sequence[str]) -> Tuple[List[Path], Optional[Path]]:
             except StopIteration as exc:  # pragma: no cover - defensive
                 raise ValueError("Missing value for --output option") from exc
             output = Path(output_token).expanduser()
+        elif token == "--no-recompress":
+            recompress = False
         else:
             # Handle Windows context menu passing multiple files as space-delimited string
             path = Path(token).expanduser()
-            if not path.exists() and " " in token and token.lower().count('.pdf') > 1:
-                # Token contains multiple .pdf references - likely multiple files
-                # Split on .pdf boundaries to handle paths with spaces in filenames
-                parts = re.split(r'(\.pdf)\s+', token, flags=re.IGNORECASE)
-                potential_paths = []
-                i = 0
-                while i < len(parts):
-                    if i + 1 < len(parts) and parts[i + 1].lower() == '.pdf':
-                        potential_paths.append(parts[i] + parts[i + 1])
-                        i += 2
-                    elif parts[i].lower().endswith('.pdf'):
-                        # Last part that already has .pdf
-                        potential_paths.append(parts[i])
-                        i += 1
-                    else:
-                        i += 1
-                
-                if len(potential_paths) > 1 and all(Path(p).exists() for p in potential_paths):
-                    # All parts are valid paths, add them separately
-                    for p in potential_paths:
-                        pdfs.append(Path(p).expanduser())
+            low = token.lower()
+            if " " in token and low.count(".pdf") > 1 and not path.exists():
+                # Token contains multiple .pdf references - likely multiple files.
+                # Slice where ".pdf" is followed by whitespace so filenames
+                # containing spaces stay intact; missing files are reported
+                # later by main().
+                segments = []
+                start = 0
+                end = low.find(".pdf")
+                while end != -1:
+                    cut = end + 4
+                    if cut < len(low) and low[cut].isspace():
+                        segments.append(token[start:cut].lstrip())
+                        while cut < len(low) and low[cut].isspace():
+                            cut += 1
+                        start = cut
+                    end = low.find(".pdf", cut)
+                tail = token[start:].strip()
+                if tail.lower().endswith(".pdf"):
+                    segments.append(tail)
+
+                if len(segments) > 1:
+                    pdfs.extend(Path(segment).expanduser() for segment in segments)
                     continue
             pdfs.append(path)
 
-    return pdfs, output
+    return pdfs, output, recompress
 
 
 def _deduplicate(paths: Iterable[Path]) -> List[Path]:
-    """Return input paths preserving order while removing duplicates."""
+    """Return input paths preserving order while removing duplicates.
+
+    Paths are compared by their normalised absolute form, which needs no
+    filesystem access (unlike ``Path.resolve``, which can block on UNC shares).
+    """
     resolved: List[Path] = []
     seen = set()
     for path in paths:
-        try:
-            key = path.resolve(strict=False)
-        except Exception:  # pragma: no cover - unexpected, keep original path
-            key = path
+        key = os.path.normcase(os.path.abspath(str(path)))
         if key not in seen:
             seen.add(key)
             resolved.append(path)
     return resolved
 
 
+def _find_missing(paths: Sequence[Path]) -> List[str]:
+    """Return the paths that do not exist, in input order.
+
+    Paths sharing a parent directory are checked with a single ``scandir`` of
+    that directory instead of one ``stat`` call each. Directories that cannot
+    be listed (e.g. traverse-only permissions) fall back to ``exists()``.
+    The listing only holds long names and does not match 8.3 short-name
+    aliases (``REPORT~1.PDF``) the way ``exists()`` does, so names missing
+    from it are confirmed with ``exists()`` before being reported.
+    """
+    by_parent: Dict[Path, List[Path]] = {}
+    for path in paths:
+        by_parent.setdefault(path.parent, []).append(path)
+
+    names_by_parent: Dict[Path, Set[str]] = {}
+    for parent, children in by_parent.items():
+        if len(children) < 2:
+            continue
+        try:
+            with os.scandir(parent) as entries:
+                names_by_parent[parent] = {
+                    os.path.normcase(entry.name) for entry in entries
+                }
+        except OSError:
+            # Leave it out so these paths are checked with exists()
+            continue
+
+    missing: List[str] = []
+    for path in paths:
+        names = names_by_parent.get(path.parent)
+        if names is None:
+            exists = path.exists()
+        else:
+            exists = os.path.normcase(path.name) in names or path.exists()
+        if not exists:
+            missing.append(str(path))
+    return missing
+
+
 def _prepare_tk() -> Tuple[Optional["tkinter.Tk"], Optional[object], Optional[object]]:
     """Initialise Tkinter if available, return root, filedialog, messagebox."""
     try:
@@ -111,64 +198,96 @@ def _prepare_tk() -> Tuple[Optional["tkinter.Tk"], Optional[object], Optional[ob
         return None, None, None
 
 
-def _choose_output_path_native(first_pdf: Path) -> Optional[Path]:
-    """Open native Windows Save As dialog using win32com."""
-    try:
-        import win32gui
-        import win32con
-        from win32com.shell import shell, shellcon
-        
-        # Create save file dialog
-        default_name = f"{first_pdf.stem}_merged.pdf"
-        initial_dir = str(first_pdf.parent)
-        
-        # Use GetSaveFileNameW for native Windows dialog
-        filter_str = "PDF Files\0*.pdf\0All Files\0*.*\0\0"
-        
-        custom_filter = "PDF Files (*.pdf)\0*.pdf\0All Files (*.*)\0*.*\0"
-        flags = (
-            win32con.OFN_OVERWRITEPROMPT |
-            win32con.OFN_HIDEREADONLY |
-            win32con.OFN_EXPLORER
-        )
-        
-        fname, _, _ = win32gui.GetSaveFileNameW(
-            InitialDir=initial_dir,
-            Flags=flags,
-            File=default_name,
-            DefExt="pdf",
-            Title="Merge PDF - Choose destination",
-            Filter=custom_filter,
-            FilterIndex=1
-        )
-        
-        if fname:
-            return Path(fname)
+def _save_dialog_win32(default_name: str, initial_dir: str) -> Optional[Path]:
+    """Open the native Windows Save As dialog through comdlg32 via ctypes.
+
+    Returns None when the user cancels or the dialog is unavailable.
+    """
+    if sys.platform != "win32":
         return None
+
+    import ctypes
+    from ctypes import wintypes
+
+    class OPENFILENAMEW(ctypes.Structure):
+        _fields_ = [
+            ("lStructSize", wintypes.DWORD),
+            ("hwndOwner", wintypes.HWND),
+            ("hInstance", wintypes.HINSTANCE),
+            ("lpstrFilter", wintypes.LPCWSTR),
+            ("lpstrCustomFilter", wintypes.LPWSTR),
+            ("nMaxCustFilter", wintypes.DWORD),
+            ("nFilterIndex", wintypes.DWORD),
+            ("lpstrFile", wintypes.LPWSTR),
+            ("nMaxFile", wintypes.DWORD),
+            ("lpstrFileTitle", wintypes.LPWSTR),
+            ("nMaxFileTitle", wintypes.DWORD),
+            ("lpstrInitialDir", wintypes.LPCWSTR),
+            ("lpstrTitle", wintypes.LPCWSTR),
+            ("Flags", wintypes.DWORD),
+            ("nFileOffset", wintypes.WORD),
+            ("nFileExtension", wintypes.WORD),
+            ("lpstrDefExt", wintypes.LPCWSTR),
+            ("lCustData", wintypes.LPARAM),
+            ("lpfnHook", ctypes.c_void_p),
+            ("lpTemplateName", wintypes.LPCWSTR),
+            ("pvReserved", ctypes.c_void_p),
+            ("dwReserved", wintypes.DWORD),
+            ("FlagsEx", wintypes.DWORD),
+        ]
+
+    OFN_OVERWRITEPROMPT = 0x00000002
+    OFN_HIDEREADONLY = 0x00000004
+    OFN_EXPLORER = 0x00080000
+
+    # The filter is a list of NUL-separated pairs, so it needs a raw buffer
+    filter_buffer = ctypes.create_unicode_buffer(
+        "PDF Files (*.pdf)\0*.pdf\0All Files (*.*)\0*.*\0\0"
+    )
+    file_buffer = ctypes.create_unicode_buffer(default_name, 32768)
+
+    ofn = OPENFILENAMEW()
+    ofn.lStructSize = ctypes.sizeof(OPENFILENAMEW)
+    ofn.lpstrFilter = ctypes.cast(filter_buffer, wintypes.LPCWSTR)
+    ofn.nFilterIndex = 1
+    ofn.lpstrFile = ctypes.cast(file_buffer, wintypes.LPWSTR)
+    ofn.nMaxFile = len(file_buffer)
+    ofn.lpstrInitialDir = initial_dir
+    ofn.lpstrTitle = "Merge PDF - Choose destination"
+    ofn.Flags = OFN_OVERWRITEPROMPT | OFN_HIDEREADONLY | OFN_EXPLORER
+    ofn.lpstrDefExt = "pdf"
+
+    try:
+        get_save_file_name = ctypes.windll.comdlg32.GetSaveFileNameW
+        get_save_file_name.argtypes = [ctypes.POINTER(OPENFILENAMEW)]
+        get_save_file_name.restype = wintypes.BOOL
+        if not get_save_file_name(ctypes.byref(ofn)):
+            return None
     except Exception:
-        # Fall back to Tkinter
         return None
 
+    if not file_buffer.value:
+        return None
+    return Path(file_buffer.value)
+
 def _choose_output_path(
     filedialog_module: object,
     first_pdf: Path,
 ) -> Optional[Path]:
     """Open a save dialog to pick the output path."""
-    # Try native Windows dialog first (more reliable)
-    try:
-        result = _choose_output_path_native(first_pdf)
-        if result is not None:
-            return result
-    except:
-        pass
-    
+    default_name = f"{first_pdf.stem}_merged.pdf"
+    initial_dir = str(first_pdf.parent)
+
+    # Try native Windows dialog first (no Tk start-up cost)
+    result = _save_dialog_win32(default_name, initial_dir)
+    if result is not None:
+        return result
+
     # Fall back to Tkinter
     if filedialog_module is None:
         return None
 
     filedialog = filedialog_module  # avoid mypy error for attribute access
-    default_name = f"{first_pdf.stem}_merged.pdf"
-    initial_dir = str(first_pdf.parent)
     # pylint: disable=E1101  # attribute defined on tkinter filedialog
     destination = filedialog.asksaveasfilename(
         title="Merge PDF - Choose destination",
@@ -182,12 +301,12 @@ def _choose_output_path(
     return Path(destination)
 
 
-def _show_message(
-    messagebox_module: Optional[object],
-    kind: str,
-    text: str,
-) -> None:
-    """Display a modern Windows 11 toast notification."""
+def _show_message(kind: str, text: str) -> None:
+    """Display a modern Windows 11 toast notification.
+
+    Tkinter is only started when the toast cannot be shown, and torn down
+    again once the message box is closed.
+    """
     if WINOTIFY_AVAILABLE:
         try:
             toast = Notification(
@@ -209,6 +328,7 @@ def _show_message(
             pass  # Fall back to Tkinter if toast fails
     
     # Fallback to Tkinter or console
+    root, _, messagebox_module = _prepare_tk()
     if messagebox_module is None:
         if kind == "error":
             print(f"Error: {text}", file=sys.stderr)
@@ -218,37 +338,135 @@ def _show_message(
 
     messagebox = messagebox_module  # avoid mypy attribute warning
     title = "Merge PDF"
-    if kind == "error":
-        messagebox.showerror(title, text)
-    elif kind == "warning":
-        messagebox.showwarning(title, text)
-    else:
-        messagebox.showinfo(title, text)
+    try:
+        if kind == "error":
+            messagebox.showerror(title, text)
+        elif kind == "warning":
+            messagebox.showwarning(title, text)
+        else:
+            messagebox.showinfo(title, text)
+    finally:
+        try:
+            root.destroy()
+        except Exception:
+            pass
 
 
-def merge_pdfs(pdfs: Sequence[Path], destination: Path) -> None:
-    """Merge provided PDF files into `destination`."""
-    PdfReader, PdfWriter, backend_name = _load_pdf_backend()
-    if not PdfReader or not PdfWriter:
-        raise RuntimeError(
-            "Could not import a PDF backend. Install one with:\n"
-            "  py -m pip install pypdf\n"
-            "or\n"
-            "  py -m pip install PyPDF2"
-        )
+def _merge_with_pikepdf(
+    pikepdf: object,
+    pdfs: Sequence[Path],
+    destination: Path,
+    recompress: bool = True,
+) -> None:
+    """Merge using pikepdf, letting libqpdf copy the page object graphs."""
+    # Source documents must stay open until the output has been saved because
+    # copied pages still reference their objects.
+    with contextlib.ExitStack() as stack:
+        out = stack.enter_context(pikepdf.Pdf.new())
+        for pdf in pdfs:
+            try:
+                src = stack.enter_context(pikepdf.Pdf.open(str(pdf)))
+            except Exception as exc:
+                raise RuntimeError(f"Failed to read '{pdf}': {exc}") from exc
 
-    writer = PdfWriter()
-    for pdf in pdfs:
+            try:
+                out.pages.extend(src.pages)
+            except Exception as exc:  # pragma: no cover - backend specific
+                raise RuntimeError(f"Failed to merge '{pdf}': {exc}") from exc
+
+        if recompress:
+            save_options = {
+                "object_stream_mode": pikepdf.ObjectStreamMode.generate,
+            }
+        else:
+            # Copy content streams verbatim: no decode/re-deflate cycle.
+            save_options = {
+                "object_stream_mode": pikepdf.ObjectStreamMode.preserve,
+                "compress_streams": False,
+                "stream_decode_level": pikepdf.StreamDecodeLevel.none,
+            }
+
+        destination.parent.mkdir(parents=True, exist_ok=True)
         try:
-            reader = PdfReader(str(pdf))
+            out.save(str(destination), linearize=False, **save_options)
         except Exception as exc:
-            raise RuntimeError(f"Failed to read '{pdf}': {exc}") from exc
+            raise RuntimeError(f"Failed to write '{destination}': {exc}") from exc
+
 
+def _merge_with_pymupdf(
+    pymupdf: object,
+    pdfs: Sequence[Path],
+    destination: Path,
+    recompress: bool = True,
+) -> None:
+    """Merge using PyMuPDF, letting MuPDF copy each document in one call."""
+    with pymupdf.open() as doc:
+        for pdf in pdfs:
+            try:
+                src = pymupdf.open(str(pdf))
+            except Exception as exc:
+                raise RuntimeError(f"Failed to read '{pdf}': {exc}") from exc
+
+            with src:
+                try:
+                    doc.insert_pdf(src)
+                except Exception as exc:  # pragma: no cover - backend specific
+                    raise RuntimeError(f"Failed to merge '{pdf}': {exc}") from exc
+
+        destination.parent.mkdir(parents=True, exist_ok=True)
         try:
-            for page in reader.pages:
-                writer.add_page(page)
-        except Exception as exc:  # pragma: no cover - backend specific
-            raise RuntimeError(f"Failed to merge '{pdf}': {exc}") from exc
+            doc.save(
+                str(destination),
+                garbage=3,
+                deflate=recompress,
+                clean=recompress,
+            )
+        except Exception as exc:
+            raise RuntimeError(f"Failed to write '{destination}': {exc}") from exc
+
+
+def _merge_with_pypdf(
+    PdfReader: object,
+    PdfWriter: object,
+    pdfs: Sequence[Path],
+    destination: Path,
+) -> None:
+    """Merge using pypdf or PyPDF2, copying pages in Python.
+
+    Readers for the next few inputs are built on worker threads while the
+    current one is appended, overlapping file reads with page copying.
+    """
+    writer = PdfWriter()
+    # pypdf >= 3 appends a whole reader in one call; older versions need
+    # append_pages_from_reader().
+    can_append = hasattr(writer, "append")
+    workers = min(_PREFETCH_READERS, len(pdfs)) or 1
+    inputs = iter(pdfs)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        # Limit reads to `workers` files at a time; appended readers are
+        # still kept alive by the writer until the merge finishes
+        pending = collections.deque(
+            (pdf, executor.submit(PdfReader, str(pdf)))
+            for pdf in itertools.islice(inputs, workers)
+        )
+        while pending:
+            pdf, future = pending.popleft()
+            next_pdf = next(inputs, None)
+            if next_pdf is not None:
+                pending.append((next_pdf, executor.submit(PdfReader, str(next_pdf))))
+
+            try:
+                reader = future.result()
+            except Exception as exc:
+                raise RuntimeError(f"Failed to read '{pdf}': {exc}") from exc
+
+            try:
+                if can_append:
+                    writer.append(reader)
+                else:
+                    writer.append_pages_from_reader(reader)
+            except Exception as exc:  # pragma: no cover - backend specific
+                raise RuntimeError(f"Failed to merge '{pdf}': {exc}") from exc
 
     destination.parent.mkdir(parents=True, exist_ok=True)
     try:
@@ -257,36 +475,61 @@ def merge_pdfs(pdfs: Sequence[Path], destination: Path) -> None:
     except Exception as exc:
         raise RuntimeError(f"Failed to write '{destination}': {exc}") from exc
 
-    if backend_name:
-        flush = getattr(writer, "flush", None)
-        if callable(flush):
-            try:
-                flush()
-            except Exception:  # pragma: no cover - optional cleanup
-                pass
+    flush = getattr(writer, "flush", None)
+    if callable(flush):
+        try:
+            flush()
+        except Exception:  # pragma: no cover - optional cleanup
+            pass
+
+
+def merge_pdfs(
+    pdfs: Sequence[Path],
+    destination: Path,
+    recompress: bool = True,
+) -> None:
+    """Merge provided PDF files into `destination`.
+
+    With ``recompress=False`` the native backends copy content streams as-is
+    instead of decoding and deflating them again; pypdf never recompresses.
+    """
+    if _BACKEND is None:
+        raise RuntimeError(
+            "Could not import a PDF backend. Install one with:\n"
+            "  py -m pip install pikepdf\n"
+            "or\n"
+            "  py -m pip install pypdf"
+        )
+
+    if not recompress and _BACKEND not in ("pikepdf", "pymupdf"):
+        _log(f"--no-recompress ignored: {_BACKEND} backend copies streams as-is")
+
+    if _BACKEND == "pikepdf":
+        _merge_with_pikepdf(_PDF_READER, pdfs, destination, recompress)
+    elif _BACKEND == "pymupdf":
+        _merge_with_pymupdf(_PDF_READER, pdfs, destination, recompress)
+    else:
+        _merge_with_pypdf(_PDF_READER, _PDF_WRITER, pdfs, destination)
 
 
 def main(argv: Sequence[str]) -> int:
     _log(f"argv -> {list(argv)}")
-    pdfs, explicit_output = _parse_args(argv)
+    pdfs, explicit_output, recompress = _parse_args(argv)
     pdfs = _deduplicate(pdfs)
     _log(f"deduplicated -> {[str(p) for p in pdfs]}")
 
-    root, filedialog_module, messagebox_module = _prepare_tk()
     try:
         if not pdfs:
             _show_message(
-                messagebox_module,
                 "error",
                 "Please select at least 2 PDF files to merge",
             )
             return 1
 
-        missing = [str(path) for path in pdfs if not path.exists()]
+        missing = _find_missing(pdfs)
         if missing:
             formatted = "\n".join(missing)
             _show_message(
-                messagebox_module,
                 "error",
                 f"Files not found:\n{formatted}",
             )
@@ -294,7 +537,6 @@ def main(argv: Sequence[str]) -> int:
 
         if len(pdfs) < 2:
             _show_message(
-                messagebox_module,
                 "warning",
                 "Select 2 or more PDF files to merge",
             )
@@ -322,7 +564,7 @@ def main(argv: Sequence[str]) -> int:
 
         # Note: Windows Save As dialog already handles overwrite confirmation
         # so we don't need to ask again for a better UX
-        merge_pdfs(pdfs, destination)
+        merge_pdfs(pdfs, destination, recompress)
 
         _log(f"merged -> {len(pdfs)} files into {destination}")
         
@@ -333,28 +575,27 @@ def main(argv: Sequence[str]) -> int:
             msg = f"Merged {len(pdfs)} PDF files\n\nSaved as: {destination.name}\nLocation: {destination.parent}"
         
         _show_message(
-            messagebox_module,
             "info",
             msg,
         )
         return 0
     except RuntimeError as exc:
-        _show_message(messagebox_module, "error", str(exc))
+        _show_message("error", str(exc))
         return 1
     finally:
         _log("main finished")
-        if root is not None:
-            try:
-                root.destroy()
-            except Exception:
-                pass
 
 
 LOG_FILE = Path(tempfile.gettempdir()) / "merge_pdfs.log"
 
+# Logging is opt-in: set PDF_MERGE_DEBUG=1 or create the log file to enable it.
+_LOG_ENABLED = os.environ.get("PDF_MERGE_DEBUG") == "1" or LOG_FILE.exists()
+
 
 def _log(message: str) -> None:
     """Append diagnostic messages to a temp file."""
+    if not _LOG_ENABLED:
+        return
     timestamp = datetime.datetime.now().isoformat(timespec="seconds")
     try:
         with LOG_FILE.open("a", encoding="utf-8") as handle:
@@ -81,7 +81,7 @@ try {
     Start-Sleep -Milliseconds 300
     
     # Step 5: Install packages
-    & $pythonExe -m pip install --no-warn-script-location pypdf winotify filelock pywin32 2>&1 | Out-Null
+    & $pythonExe -m pip install --no-warn-script-location pypdf winotify 2>&1 | Out-Null
     Show-Progress -Percent 70 -Status "Libraries installed"
     Start-Sleep -Milliseconds 300
 